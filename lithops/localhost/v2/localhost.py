@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 
-import copy
 import os
 import json
 import threading
@@ -217,11 +216,14 @@ class ExecutionEnvironment:
         self.jobs[job_key] = CountDownLatch(len(job_payload['call_ids']))
         os.makedirs(os.path.join(JOBS_DIR, job_key), exist_ok=True)
 
+        # build each task payload as a shallow overlay of the job payload,
+        # only the per-task keys differ so there is no need to deep-copy
+        # the whole job payload once per call
         dbr = job_payload['data_byte_ranges']
-        for call_id in job_payload['call_ids']:
-            task_payload = copy.deepcopy(job_payload)
+        for call_id, byte_range in zip(job_payload['call_ids'], dbr):
+            task_payload = dict(job_payload)
             task_payload['call_ids'] = [call_id]
-            task_payload['data_byte_ranges'] = [dbr[int(call_id)]]
+            task_payload['data_byte_ranges'] = [byte_range]
             self.work_queue.put(json.dumps(task_payload))
 
     def start(self):
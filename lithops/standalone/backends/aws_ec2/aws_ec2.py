@@ -24,10 +24,11 @@ import boto3
 import botocore
 from botocore.exceptions import ClientError
 from datetime import datetime
+from threading import Lock
 from concurrent.futures import ThreadPoolExecutor
 
 from lithops.version import __version__
-from lithops.util.ssh_client import SSHClient
+from lithops.util.ssh_client import get_pooled_ssh_client, discard_pooled_ssh_client
 from lithops.constants import COMPUTE_CLI_MSG, CACHE_DIR
 from lithops.config import load_yaml_config, dump_yaml_config
 from lithops.standalone.utils import CLOUD_CONFIG_WORKER, CLOUD_CONFIG_WORKER_PK, StandaloneMode, get_host_setup_script
@@ -96,6 +97,9 @@ class AWSEC2Backend:
 
         self.master = None
         self.workers = []
+        # create_worker runs from a thread pool, so the workers
+        # list is guarded against concurrent appends and snapshots
+        self.workers_lock = Lock()
 
         msg = COMPUTE_CLI_MSG.format('AWS EC2')
         logger.info(f"{msg} - Region: {self.region_name}")
@@ -942,11 +946,14 @@ class AWSEC2Backend:
         """
         Stop all worker VM instances
         """
-        if len(self.workers) > 0:
-            with ThreadPoolExecutor(len(self.workers)) as ex:
-                ex.map(lambda worker: worker.stop(), self.workers)
+        with self.workers_lock:
+            workers = self.workers
             self.workers = []
 
+        if len(workers) > 0:
+            with ThreadPoolExecutor(min(len(workers), 48)) as ex:
+                ex.map(lambda worker: worker.stop(), workers)
+
         if include_master:
             self.master.stop()
 
@@ -997,7 +1004,8 @@ class AWSEC2Backend:
             user_data = CLOUD_CONFIG_WORKER.format(user, token)
 
         worker.create(user_data=user_data)
-        self.workers.append(worker)
+        with self.workers_lock:
+            self.workers.append(worker)
 
     def get_runtime_key(self, runtime_name, version=__version__):
         """
@@ -1074,10 +1082,10 @@ class EC2Instance:
         """
         if self.public:
             if not self.ssh_client or self.ssh_client.ip_address != self.public_ip:
-                self.ssh_client = SSHClient(self.public_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.public_ip, self.ssh_credentials)
         else:
             if not self.ssh_client or self.ssh_client.ip_address != self.private_ip:
-                self.ssh_client = SSHClient(self.private_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.private_ip, self.ssh_credentials)
 
         return self.ssh_client
 
@@ -1086,10 +1094,7 @@ class EC2Instance:
         Deletes the ssh client
         """
         if self.ssh_client:
-            try:
-                self.ssh_client.close()
-            except Exception:
-                pass
+            discard_pooled_ssh_client(self.ssh_client)
             self.ssh_client = None
 
     def is_ready(self):
@@ -1104,7 +1109,10 @@ class EC2Instance:
             raise err
         except Exception as err:
             logger.debug(f'SSH to {self.public_ip if self.public else self.private_ip} failed ({login_type}): {err}')
-            self.del_ssh_client()
+            # keep the transport if it is still alive so the next probe
+            # does not pay a new SSH handshake
+            if self.ssh_client and not self.ssh_client.is_active():
+                self.del_ssh_client()
             return False
         return True
 
@@ -1118,12 +1126,17 @@ class EC2Instance:
 
         self.get_public_ip() if self.public else self.get_private_ip()
 
+        # exponential backoff: fast VMs are detected within a second
+        # while slow boots do not accumulate dozens of SSH probes
+        probe_interval = 0.5
+
         while (time.time() - start < timeout):
             if self.is_ready():
                 start_time = round(time.time() - start, 2)
                 logger.debug(f'{self} ready in {start_time} seconds')
                 return True
-            time.sleep(5)
+            time.sleep(probe_interval)
+            probe_interval = min(probe_interval * 2, 8)
 
         raise TimeoutError(f'Readiness probe expired on {self}')
 
@@ -20,6 +20,7 @@ import time
 import uuid
 import logging
 import base64
+from threading import Lock
 from concurrent.futures import ThreadPoolExecutor
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.compute import ComputeManagementClient
@@ -27,7 +28,7 @@ from azure.mgmt.network import NetworkManagementClient
 from azure.core.exceptions import ResourceNotFoundError
 
 from lithops.version import __version__
-from lithops.util.ssh_client import SSHClient
+from lithops.util.ssh_client import get_pooled_ssh_client, discard_pooled_ssh_client
 from lithops.constants import COMPUTE_CLI_MSG, CACHE_DIR, SA_CONFIG_FILE
 from lithops.config import load_yaml_config, dump_yaml_config
 from lithops.standalone.utils import StandaloneMode
@@ -74,6 +75,9 @@ class AzureVMSBackend:
 
         self.master = None
         self.workers = []
+        # create_worker runs from a thread pool, so the workers
+        # list is guarded against concurrent appends and snapshots
+        self.workers_lock = Lock()
         self.instance_types = {}
 
         msg = COMPUTE_CLI_MSG.format('Azure Virtual Machines')
@@ -528,7 +532,7 @@ class AzureVMSBackend:
             poller.result()
 
         if len(instances_to_delete) > 0:
-            with ThreadPoolExecutor(len(instances_to_delete)) as executor:
+            with ThreadPoolExecutor(min(len(instances_to_delete), 48)) as executor:
                 futures = [executor.submit(delete_instance, i) for i in instances_to_delete]
                 [fut.result() for fut in futures]
 
@@ -619,11 +623,14 @@ class AzureVMSBackend:
         """
         Stop all worker VM instances
         """
-        if len(self.workers) > 0:
-            with ThreadPoolExecutor(len(self.workers)) as ex:
-                ex.map(lambda worker: worker.stop(), self.workers)
+        with self.workers_lock:
+            workers = self.workers
             self.workers = []
 
+        if len(workers) > 0:
+            with ThreadPoolExecutor(min(len(workers), 48)) as ex:
+                ex.map(lambda worker: worker.stop(), workers)
+
         if include_master:
             self.master.stop()
 
@@ -662,7 +669,8 @@ class AzureVMSBackend:
         worker.ssh_credentials.pop('password')
         worker.create()
         worker.ssh_credentials['key_filename'] = '~/.ssh/lithops_id_rsa'
-        self.workers.append(worker)
+        with self.workers_lock:
+            self.workers.append(worker)
 
     def get_runtime_key(self, runtime_name, version=__version__):
         """
@@ -732,10 +740,10 @@ class VMInstance:
         """
         if self.public:
             if not self.ssh_client or self.ssh_client.ip_address != self.public_ip:
-                self.ssh_client = SSHClient(self.public_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.public_ip, self.ssh_credentials)
         else:
             if not self.ssh_client or self.ssh_client.ip_address != self.private_ip:
-                self.ssh_client = SSHClient(self.private_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.private_ip, self.ssh_credentials)
 
         return self.ssh_client
 
@@ -744,10 +752,7 @@ class VMInstance:
         Deletes the ssh client
         """
         if self.ssh_client:
-            try:
-                self.ssh_client.close()
-            except Exception:
-                pass
+            discard_pooled_ssh_client(self.ssh_client)
             self.ssh_client = None
 
     def is_ready(self):
@@ -762,7 +767,10 @@ class VMInstance:
             raise err
         except Exception as err:
             logger.debug(f'SSH to {self.public_ip if self.public else self.private_ip} failed ({login_type}): {err}')
-            self.del_ssh_client()
+            # keep the transport if it is still alive so the next probe
+            # does not pay a new SSH handshake
+            if self.ssh_client and not self.ssh_client.is_active():
+                self.del_ssh_client()
             return False
         return True
 
@@ -776,12 +784,17 @@ class VMInstance:
 
         self.get_public_ip() if self.public else self.get_private_ip()
 
+        # exponential backoff: fast VMs are detected within a second
+        # while slow boots do not accumulate dozens of SSH probes
+        probe_interval = 0.5
+
         while (time.time() - start < timeout):
             if self.is_ready():
                 start_time = round(time.time() - start, 2)
                 logger.debug(f'{self} ready in {start_time} seconds')
                 return True
-            time.sleep(5)
+            time.sleep(probe_interval)
+            probe_interval = min(probe_interval * 2, 8)
 
         raise TimeoutError(f'Readiness probe expired on {self}')
 
@@ -26,10 +26,11 @@ from datetime import datetime
 from ibm_vpc import VpcV1
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from ibm_cloud_sdk_core import ApiException
+from threading import Lock
 from concurrent.futures import ThreadPoolExecutor
 
 from lithops.version import __version__
-from lithops.util.ssh_client import SSHClient
+from lithops.util.ssh_client import get_pooled_ssh_client, discard_pooled_ssh_client
 from lithops.constants import COMPUTE_CLI_MSG, CACHE_DIR
 from lithops.config import load_yaml_config, dump_yaml_config
 from lithops.standalone.utils import (
@@ -76,6 +77,9 @@ class IBMVPCBackend:
 
         self.master = None
         self.workers = []
+        # create_worker runs from a thread pool, so the workers
+        # list is guarded against concurrent appends and snapshots
+        self.workers_lock = Lock()
 
         self.iam_api_key = self.config.get('iam_api_key')
         authenticator = IAMAuthenticator(self.iam_api_key, url=self.config.get('iam_endpoint'))
@@ -685,7 +689,7 @@ class IBMVPCBackend:
                     instances_to_delete.add(ins_to_delete)
 
             if instances_to_delete:
-                with ThreadPoolExecutor(len(instances_to_delete)) as executor:
+                with ThreadPoolExecutor(min(len(instances_to_delete), 48)) as executor:
                     executor.map(delete_instance, instances_to_delete)
                 deleted_instances.update(instances_to_delete)
             else:
@@ -818,11 +822,14 @@ class IBMVPCBackend:
         """
         Stop all worker VM instances
         """
-        if len(self.workers) > 0:
-            with ThreadPoolExecutor(min(len(self.workers), 48)) as ex:
-                ex.map(lambda worker: worker.stop(), self.workers)
+        with self.workers_lock:
+            workers = self.workers
             self.workers = []
 
+        if len(workers) > 0:
+            with ThreadPoolExecutor(min(len(workers), 48)) as ex:
+                ex.map(lambda worker: worker.stop(), workers)
+
         if include_master:
             self.master.stop()
 
@@ -873,7 +880,8 @@ class IBMVPCBackend:
             user_data = CLOUD_CONFIG_WORKER.format(user, token)
 
         worker.create(user_data=user_data)
-        self.workers.append(worker)
+        with self.workers_lock:
+            self.workers.append(worker)
 
     def get_runtime_key(self, runtime_name, version=__version__):
         """
@@ -940,10 +948,10 @@ class IBMVPCInstance:
         """
         if self.public:
             if not self.ssh_client or self.ssh_client.ip_address != self.public_ip:
-                self.ssh_client = SSHClient(self.public_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.public_ip, self.ssh_credentials)
         else:
             if not self.ssh_client or self.ssh_client.ip_address != self.private_ip:
-                self.ssh_client = SSHClient(self.private_ip, self.ssh_credentials)
+                self.ssh_client = get_pooled_ssh_client(self.private_ip, self.ssh_credentials)
 
         return self.ssh_client
 
@@ -952,10 +960,7 @@ class IBMVPCInstance:
         Deletes the ssh client
         """
         if self.ssh_client:
-            try:
-                self.ssh_client.close()
-            except Exception:
-                pass
+            discard_pooled_ssh_client(self.ssh_client)
             self.ssh_client = None
 
     def is_ready(self):
@@ -970,7 +975,10 @@ class IBMVPCInstance:
             raise err
         except Exception as err:
             logger.debug(f'SSH to {self.public_ip if self.public else self.private_ip} failed ({login_type}): {err}')
-            self.del_ssh_client()
+            # keep the transport if it is still alive so the next probe
+            # does not pay a new SSH handshake
+            if self.ssh_client and not self.ssh_client.is_active():
+                self.del_ssh_client()
             return False
         return True
 
@@ -984,12 +992,17 @@ class IBMVPCInstance:
 
         self.get_public_ip() if self.public else self.get_private_ip()
 
+        # exponential backoff: fast VMs are detected within a second
+        # while slow boots do not accumulate dozens of SSH probes
+        probe_interval = 0.5
+
         while (time.time() - start < timeout):
             if self.is_ready():
                 start_time = round(time.time() - start, 2)
                 logger.debug(f'{self} ready in {start_time} seconds')
                 return True
-            time.sleep(5)
+            time.sleep(probe_interval)
+            probe_interval = min(probe_interval * 2, 8)
 
         raise TimeoutError(f'Readiness probe expired on {self}')
 
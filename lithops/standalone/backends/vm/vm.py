@@ -21,7 +21,7 @@ import time
 from lithops.standalone.utils import StandaloneMode
 from lithops.version import __version__
 from lithops.constants import COMPUTE_CLI_MSG
-from lithops.util.ssh_client import SSHClient
+from lithops.util.ssh_client import get_pooled_ssh_client, discard_pooled_ssh_client
 from lithops.standalone import LithopsValidationError
 
 logger = logging.getLogger(__name__)
@@ -103,7 +103,7 @@ class VMInstance:
                 'password': self.config.get('ssh_password', None),
                 'key_filename': self.config.get('ssh_key_filename', '~/.ssh/id_rsa')
             }
-            self.ssh_client = SSHClient(self.public_ip, ssh_credentials)
+            self.ssh_client = get_pooled_ssh_client(self.public_ip, ssh_credentials)
         return self.ssh_client
 
     def del_ssh_client(self):
@@ -111,10 +111,7 @@ class VMInstance:
         Deletes the ssh client
         """
         if self.ssh_client:
-            try:
-                self.ssh_client.close()
-            except Exception:
-                pass
+            discard_pooled_ssh_client(self.ssh_client)
             self.ssh_client = None
 
     def is_ready(self):
@@ -127,7 +124,10 @@ class VMInstance:
             raise e
         except Exception as e:
             logger.debug(f'ssh to {self.public_ip} failed: {e}')
-            self.del_ssh_client()
+            # keep the transport if it is still alive so the next probe
+            # does not pay a new SSH handshake
+            if self.ssh_client and not self.ssh_client.is_active():
+                self.del_ssh_client()
             return False
         return True
 
@@ -138,12 +138,17 @@ class VMInstance:
         logger.debug(f'Waiting {self} to become ready')
 
         start = time.time()
+        # exponential backoff: fast VMs are detected within a second
+        # while slow boots do not accumulate dozens of SSH probes
+        probe_interval = 0.5
+
         while (time.time() - start < timeout):
             if self.is_ready():
                 start_time = round(time.time() - start, 2)
                 logger.debug(f'{self} ready in {start_time} seconds')
                 return True
-            time.sleep(5)
+            time.sleep(probe_interval)
+            probe_interval = min(probe_interval * 2, 8)
 
         raise TimeoutError(f'Readiness probe expired on {self}')
 
@@ -23,16 +23,25 @@ from lithops.standalone import StandaloneHandler
 from lithops.constants import JOBS_DIR
 from lithops.standalone.utils import JobStatus
 
+try:
+    import gevent
+except ImportError:
+    gevent = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
 
 logger = logging.getLogger(__name__)
 
 
-class BudgetKeeper(threading.Thread):
+class BudgetKeeper:
     """
     BudgetKeeper class used to automatically stop the VM instance
     """
     def __init__(self, config, instance_data, stop_callback=None, delete_callback=None):
-        threading.Thread.__init__(self)
         self.last_usage_time = time.time()
 
         self.standalone_config = config
@@ -54,6 +63,18 @@ class BudgetKeeper(threading.Thread):
                      f"instance ID: {self.instance.instance_id}")
         logger.debug(f"Delete {self.instance.name} on dismantle: {self.instance.delete_on_dismantle}")
 
+    def start(self):
+        """
+        Starts the keeper loop. The master and worker services run on
+        gevent, so the loop is spawned as a greenlet there instead of
+        holding a kernel thread; a daemon thread is kept as fallback
+        """
+        if gevent is not None:
+            self.keeper = gevent.spawn(self.run)
+        else:
+            self.keeper = threading.Thread(target=self.run, daemon=True)
+            self.keeper.start()
+
     def get_time_to_dismantle(self):
         return self.time_to_dismantle
 
@@ -61,6 +82,22 @@ class BudgetKeeper(threading.Thread):
         self.last_usage_time = time.time()
         self.jobs[job_key] = JobStatus.RUNNING.value
 
+    def _watch_jobs_dir(self):
+        """
+        Creates an inotify watch on JOBS_DIR so finished jobs are detected
+        from filesystem events instead of one stat() per job per iteration
+        """
+        if INotify is None:
+            return None
+        try:
+            os.makedirs(JOBS_DIR, exist_ok=True)
+            inotify = INotify()
+            inotify.add_watch(JOBS_DIR, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            return inotify
+        except Exception as e:
+            logger.debug(f"Unable to watch {JOBS_DIR} with inotify: {e}")
+            return None
+
     def run(self):
         self.runing = True
         jobs_running = False
@@ -76,13 +113,26 @@ class BudgetKeeper(threading.Thread):
             # being started forever due a wrong configuration
             logger.debug(f'Auto dismantle deactivated - Hard Timeout: {self.hard_dismantle_timeout}s')
 
+        inotify = self._watch_jobs_dir()
+        done_jobs = set()
+
+        if inotify is not None:
+            # catch up with the jobs that finished before the watch was in place
+            done_jobs.update(f[:-5] for f in os.listdir(JOBS_DIR) if f.endswith('.done'))
+
         while self.runing:
             time_since_last_usage = time.time() - self.last_usage_time
 
-            for job_key in self.jobs.keys():
-                done = os.path.join(JOBS_DIR, job_key + '.done')
-                if os.path.isfile(done):
-                    self.jobs[job_key] = JobStatus.DONE.value
+            if inotify is None:
+                # one scandir batch instead of a stat() per known job
+                try:
+                    done_jobs.update(entry.name[:-5] for entry in os.scandir(JOBS_DIR)
+                                     if entry.name.endswith('.done'))
+                except FileNotFoundError:
+                    pass
+
+            for job_key in self.jobs.keys() & done_jobs:
+                self.jobs[job_key] = JobStatus.DONE.value
 
             if len(self.jobs) > 0 and all(value == JobStatus.DONE.value for value in self.jobs.values()) \
                and self.auto_dismantle:
@@ -103,7 +153,13 @@ class BudgetKeeper(threading.Thread):
             if self.time_to_dismantle > 0:
                 logger.debug(f"Time to dismantle: {self.time_to_dismantle} seconds")
                 check_interval = min(60, max(self.time_to_dismantle / 10, 1))
-                time.sleep(check_interval)
+                if inotify is not None:
+                    # sleep until a .done file is written or the interval expires
+                    for event in inotify.read(timeout=int(check_interval * 1000)):
+                        if event.name.endswith('.done'):
+                            done_jobs.add(event.name[:-5])
+                else:
+                    time.sleep(check_interval)
             else:
                 self.stop_instance()
 
@@ -15,32 +15,41 @@
 # limitations under the License.
 #
 
-import os
-import copy
-import time
-import json
-import uuid
-import redis
-import flask
-import logging
-import requests
-import concurrent.futures as cf
-from pathlib import Path
-from datetime import datetime
-from gevent.pywsgi import WSGIServer
-from threading import Thread
-from concurrent.futures import ThreadPoolExecutor
-
-from lithops.version import __version__
-from lithops.localhost import LocalhostHandler
-from lithops.standalone import LithopsValidationError
-from lithops.standalone.keeper import BudgetKeeper
-from lithops.config import extract_standalone_config
-from lithops.standalone.standalone import StandaloneHandler
-from lithops.version import __version__ as lithops_version
-from lithops.constants import (
+# Patch the stdlib before anything else is imported, so every lock,
+# socket and poll object created at module scope (including the ones
+# inside the imported libraries) is gevent-cooperative
+from gevent import monkey
+monkey.patch_all()
+
+import io  # noqa: E402
+import os  # noqa: E402
+import time  # noqa: E402
+import json  # noqa: E402
+import uuid  # noqa: E402
+import redis  # noqa: E402
+import flask  # noqa: E402
+import gevent  # noqa: E402
+import logging  # noqa: E402
+import requests  # noqa: E402
+import concurrent.futures as cf  # noqa: E402
+from functools import lru_cache  # noqa: E402
+from pathlib import Path  # noqa: E402
+from datetime import datetime  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+from threading import Thread, Lock  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
+from lithops.version import __version__  # noqa: E402
+from lithops.localhost import LocalhostHandler  # noqa: E402
+from lithops.standalone import LithopsValidationError  # noqa: E402
+from lithops.standalone.keeper import BudgetKeeper  # noqa: E402
+from lithops.config import extract_standalone_config  # noqa: E402
+from lithops.standalone.standalone import StandaloneHandler  # noqa: E402
+from lithops.version import __version__ as lithops_version  # noqa: E402
+from lithops.constants import (  # noqa: E402
     CPU_COUNT,
     LITHOPS_TEMP_DIR,
+    SA_INSTALL_DIR,
     SA_MASTER_LOG_FILE,
     JOBS_DIR,
     SA_MASTER_SERVICE_PORT,
@@ -48,16 +57,18 @@ from lithops.constants import (
     SA_CONFIG_FILE,
     SA_MASTER_DATA_FILE
 )
-from lithops.utils import (
+from lithops.utils import (  # noqa: E402
     verify_runtime_name,
     setup_lithops_logger
 )
-from lithops.standalone.utils import (
+from lithops.standalone.utils import (  # noqa: E402
     JobStatus,
     StandaloneMode,
     WorkerStatus,
     get_host_setup_script,
-    get_worker_setup_script
+    get_worker_setup_script,
+    json_dumps,
+    json_loads
 )
 
 os.makedirs(LITHOPS_TEMP_DIR, exist_ok=True)
@@ -75,6 +86,18 @@ redis_client = None
 budget_keeper = None
 master_ip = None
 
+# Shared HTTP session so worker probes reuse keep-alive connections
+# instead of paying a TCP handshake on every request
+http_session = requests.Session()
+http_session.mount('http://', requests.adapters.HTTPAdapter(
+    pool_connections=64, pool_maxsize=64))
+
+# LocalhostHandler instances are cached per (runtime, pull_runtime), so
+# only the first /metadata request for a combination pays the handler
+# setup cost
+localhost_handlers = {}
+localhost_handlers_lock = Lock()
+
 
 # /---------------------------------------------------------------------------/
 # Workers
@@ -86,7 +109,7 @@ def is_worker_free(worker_private_ip):
     """
     url = f"http://{worker_private_ip}:{SA_WORKER_SERVICE_PORT}/ping"
     try:
-        r = requests.get(url, timeout=0.5)
+        r = http_session.get(url, timeout=0.5)
         resp = r.json()
         logger.debug(f'Worker processes status from {worker_private_ip}: {resp}')
         return True if resp.get('free', 0) > 0 else False
@@ -103,7 +126,7 @@ def get_worker_ttd(worker_private_ip):
             ttd = str(budget_keeper.get_time_to_dismantle())
         else:
             url = f"http://{worker_private_ip}:{SA_WORKER_SERVICE_PORT}/ttd"
-            r = requests.get(url, timeout=0.5)
+            r = http_session.get(url, timeout=0.5)
             ttd = r.text
         logger.debug(f'Worker TTD from {worker_private_ip}: {ttd}')
         return ttd
@@ -139,12 +162,10 @@ def list_workers():
         result.append((name, created, instance_type, worker_processes, runtime, exec_mode, status, ttd))
 
     workers = redis_client.keys('worker:*')
-    if workers:
-        with ThreadPoolExecutor(len(workers)) as ex:
-            ex.map(get_worker, workers)
+    gevent.joinall([gevent.spawn(get_worker, worker) for worker in workers])
 
     logger.debug(f"workers: {result}")
-    return flask.jsonify(result)
+    return json_response(result)
 
 
 @app.route('/worker/get', methods=['GET'])
@@ -192,25 +213,20 @@ def get_workers():
                 )
             )
 
-    if active_workers:
-        with ThreadPoolExecutor(len(active_workers)) as ex:
-            ex.map(check_worker, active_workers)
+    gevent.joinall([gevent.spawn(check_worker, worker_data) for worker_data in active_workers])
 
     logger.debug(f'Free workers for {worker_type}: {len(free_workers)}')
 
-    response = flask.jsonify(free_workers)
-    response.status_code = 200
-
-    return response
+    return json_response(free_workers)
 
 
 def save_worker(worker, standalone_config, work_queue_name):
     """
     Saves the worker instance with the provided data in redis
     """
-    config = copy.deepcopy(standalone_config)
-    del config[config['backend']]
-    config = {key: str(value) if isinstance(value, bool) else value for key, value in config.items()}
+    backend = standalone_config['backend']
+    config = {key: str(value) if isinstance(value, bool) else value
+              for key, value in standalone_config.items() if key != backend}
 
     worker_processes = CPU_COUNT if worker.config['worker_processes'] == 'AUTO' \
         else worker.config['worker_processes']
@@ -231,6 +247,16 @@ def save_worker(worker, standalone_config, work_queue_name):
     })
 
 
+@lru_cache(maxsize=None)
+def get_standalone_zip():
+    """
+    Returns the lithops standalone zip content. The same archive is
+    uploaded to every worker, so it is read from disk only once
+    """
+    with open(f'{SA_INSTALL_DIR}/lithops_standalone.zip', 'rb') as zf:
+        return zf.read()
+
+
 def setup_worker_create_reuse(standalone_handler, worker_info, work_queue_name):
     """
     Run the worker setup process and installs all the Lithops dependencies into it
@@ -288,9 +314,13 @@ def setup_worker_create_reuse(standalone_handler, worker_info, work_queue_name):
     redis_client.hset(f"worker:{worker.name}", 'err', '')
 
     try:
+        # one SSH connection is reused for the zip upload, the script
+        # upload and the installation command
+        ssh_client = worker.get_ssh_client()
+
         logger.debug(f'Uploading lithops files to {worker}')
-        worker.get_ssh_client().upload_local_file(
-            '/opt/lithops/lithops_standalone.zip',
+        ssh_client.upload_fileobj(
+            io.BytesIO(get_standalone_zip()),
             '/tmp/lithops_standalone.zip')
 
         logger.debug(f'Preparing installation script for {worker}')
@@ -309,9 +339,9 @@ def setup_worker_create_reuse(standalone_handler, worker_info, work_queue_name):
         script += get_worker_setup_script(standalone_handler.config, vm_data)
 
         logger.debug(f'Submitting installation script to {worker}')
-        worker.get_ssh_client().upload_data_to_file(script, remote_script)
+        ssh_client.upload_data_to_file(script, remote_script)
         cmd = f"chmod 777 {remote_script}; sudo {remote_script};"
-        worker.get_ssh_client().run_remote_command(cmd, run_async=True)
+        ssh_client.run_remote_command(cmd, run_async=True)
         worker.del_ssh_client()
 
         logger.debug(f'Installation script submitted to {worker}')
@@ -389,7 +419,10 @@ def handle_workers(job_payload, workers, work_queue_name):
         except Exception as e:
             logger.error(e)
     else:
-        with ThreadPoolExecutor(len(workers)) as executor:
+        # bound the pool so a large fan-out does not spawn one thread per
+        # worker, and reap the futures as they finish so setup failures
+        # surface as soon as they happen
+        with ThreadPoolExecutor(min(len(workers), 48)) as executor:
             for worker_info in workers:
                 future = executor.submit(
                     setup_worker_create_reuse,
@@ -399,12 +432,12 @@ def handle_workers(job_payload, workers, work_queue_name):
                 )
                 futures.append(future)
 
-        for future in cf.as_completed(futures):
-            try:
-                future.result()
-                total_correct += 1
-            except Exception as e:
-                logger.error(e)
+            for future in cf.as_completed(futures):
+                try:
+                    future.result()
+                    total_correct += 1
+                except Exception as e:
+                    logger.error(e)
 
     logger.debug(
         f'{total_correct} of {len(workers)} workers started '
@@ -428,7 +461,7 @@ def cancel_job_process(job_key_list):
         tmp_queue = []
         while redis_client.llen(queue_name) > 0:
             task_payload_json = redis_client.rpop(queue_name)
-            task_payload = json.loads(task_payload_json)
+            task_payload = json_loads(task_payload_json)
             if task_payload['job_key'] != job_key:
                 tmp_queue.append(task_payload_json)
 
@@ -438,12 +471,11 @@ def cancel_job_process(job_key_list):
         def stop_task(worker):
             worker_data = redis_client.hgetall(worker)
             url = f"http://{worker_data['private_ip']}:{SA_WORKER_SERVICE_PORT}/stop/{job_key}"
-            requests.post(url, timeout=0.5)
+            http_session.post(url, timeout=0.5)
 
         # Send stop signal to all workers
         workers = redis_client.keys('worker:*')
-        with ThreadPoolExecutor(len(workers)) as ex:
-            ex.map(stop_task, workers)
+        gevent.joinall([gevent.spawn(stop_task, worker) for worker in workers])
 
         Path(os.path.join(JOBS_DIR, job_key + '.done')).touch()
         if redis_client.hget(f"job:{job_key}", 'status') != JobStatus.DONE.value:
@@ -490,7 +522,7 @@ def list_jobs():
         result.append(job)
 
     logger.debug(f'jobs: {result}')
-    return flask.jsonify(result)
+    return json_response(result)
 
 
 def handle_job(job_payload, queue_name):
@@ -512,12 +544,19 @@ def handle_job(job_payload, queue_name):
         'queue_name': queue_name
     })
 
+    # The task payloads only differ in 'call_ids' and 'data_byte_ranges',
+    # so build them as shallow overlays of a common base instead of
+    # deep-copying the whole job payload once per task
     dbr = job_payload['data_byte_ranges']
-    for call_id in job_payload['call_ids']:
-        task_payload = copy.deepcopy(job_payload)
-        task_payload['call_ids'] = [call_id]
-        task_payload['data_byte_ranges'] = [dbr[int(call_id)]]
-        redis_client.lpush(queue_name, json.dumps(task_payload))
+    base_payload = {key: value for key, value in job_payload.items()
+                    if key not in ('call_ids', 'data_byte_ranges')}
+    # the invoker sends the full, ordered '00000'..N call id range, so the
+    # byte ranges can be paired with zip instead of an int() cast per task
+    for call_id, byte_range in zip(job_payload['call_ids'], dbr):
+        task_payload = {**base_payload,
+                        'call_ids': [call_id],
+                        'data_byte_ranges': [byte_range]}
+        redis_client.lpush(queue_name, json_dumps(task_payload))
 
     logger.debug(f"Job {job_key} correctly submitted to work queue '{queue_name}'")
 
@@ -527,7 +566,10 @@ def run():
     """
     Entry point for running jobs
     """
-    job_payload = flask.request.get_json(force=True, silent=True)
+    try:
+        job_payload = json_loads(flask.request.get_data())
+    except Exception:
+        job_payload = None
     if job_payload and not isinstance(job_payload, dict):
         return error('The action did not receive a dictionary as an argument')
 
@@ -559,10 +601,8 @@ def run():
     Thread(target=handle_workers, args=(job_payload, workers, queue_name)).start()
 
     act_id = str(uuid.uuid4()).replace('-', '')[:12]
-    response = flask.jsonify({'activationId': act_id})
-    response.status_code = 202
 
-    return response
+    return json_response({'activationId': act_id}, status=202)
 
 
 def job_monitor():
@@ -570,8 +610,29 @@ def job_monitor():
 
     jobs_data = {}
 
+    # Workers signal every finished task with an rpush into
+    # tasksdone:<job_key>. Ask redis to publish keyspace events for list
+    # operations so completions wake this thread immediately instead of
+    # being discovered on the next fixed-interval sweep
+    pubsub = None
+    try:
+        redis_client.config_set('notify-keyspace-events', 'Kl')
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe('__keyspace@*__:tasksdone:*')
+    except Exception as e:
+        logger.debug(f"Redis keyspace notifications unavailable, "
+                     f"falling back to periodic polling: {e}")
+        pubsub = None
+
     while True:
-        time.sleep(JOB_MONITOR_CHECK_INTERVAL)
+        if pubsub is not None:
+            pubsub.get_message(timeout=JOB_MONITOR_CHECK_INTERVAL)
+            # drain the backlog: a big job publishes one event per
+            # completed task, and a single sweep accounts for all of them
+            while pubsub.get_message(timeout=0):
+                pass
+        else:
+            time.sleep(JOB_MONITOR_CHECK_INTERVAL)
         for job_job_key in redis_client.keys('job:*'):
             job_key = job_job_key.replace("job:", "")
             if job_key not in jobs_data:
@@ -604,17 +665,27 @@ def clean():
     return ('', 204)
 
 
+# /ping always returns the same payload, so the response is built once
+# and reused for every probe
+ping_response = flask.Response(
+    json_dumps({'response': lithops_version}), mimetype='application/json')
+
+
 @app.route('/ping', methods=['GET'])
 def ping():
-    response = flask.jsonify({'response': lithops_version})
-    response.status_code = 200
-    return response
+    return ping_response
+
+
+def json_response(obj, status=200):
+    """
+    Builds a JSON response directly from precomputed bytes, skipping
+    the per-request flask.jsonify machinery
+    """
+    return flask.Response(json_dumps(obj), status=status, mimetype='application/json')
 
 
 def error(msg):
-    response = flask.jsonify({'error': msg})
-    response.status_code = 404
-    return response
+    return json_response({'error': msg}, status=404)
 
 
 @app.route('/metadata', methods=['GET'])
@@ -628,17 +699,22 @@ def get_metadata():
     except Exception as e:
         return error(str(e))
 
-    localhos_handler = LocalhostHandler(payload)
-    localhos_handler.init()
-    runtime_meta = localhos_handler.deploy_runtime(payload['runtime'])
+    runtime_name = payload['runtime']
+    handler_key = (runtime_name, payload.get('pull_runtime', False))
+    with localhost_handlers_lock:
+        localhos_handler = localhost_handlers.get(handler_key)
+        if localhos_handler is None:
+            localhos_handler = LocalhostHandler(payload)
+            localhos_handler.init()
+            localhost_handlers[handler_key] = localhos_handler
+
+    runtime_meta = localhos_handler.deploy_runtime(runtime_name)
 
     if 'lithops_version' in runtime_meta:
         logger.debug(f"Runtime metdata extracted correctly from {payload['runtime']}"
                      f" - Lithops {runtime_meta['lithops_version']}")
-    response = flask.jsonify(runtime_meta)
-    response.status_code = 200
 
-    return response
+    return json_response(runtime_meta)
 
 
 def main():
@@ -649,10 +725,10 @@ def main():
     os.makedirs(LITHOPS_TEMP_DIR, exist_ok=True)
 
     with open(SA_CONFIG_FILE, 'r') as cf:
-        standalone_config = json.load(cf)
+        standalone_config = json_loads(cf.read())
 
     with open(SA_MASTER_DATA_FILE, 'r') as ad:
-        master_data = json.load(ad)
+        master_data = json_loads(ad.read())
         master_ip = master_data['private_ip']
 
     budget_keeper = BudgetKeeper(standalone_config, master_data, stop_callback=clean)
@@ -15,16 +15,18 @@
 # limitations under the License.
 #
 
+import io
 import os
 import uuid
-import json
 import time
+import http.client
 import hashlib
 import logging
 import importlib
 import requests
 import shlex
 import concurrent.futures as cf
+from functools import lru_cache
 
 from lithops.utils import (
     BackendType,
@@ -32,7 +34,6 @@ from lithops.utils import (
     create_handler_zip
 )
 from lithops.constants import (
-    TEMP_DIR,
     SA_MASTER_SERVICE_PORT,
     SA_MASTER_DATA_FILE,
 )
@@ -40,13 +41,27 @@ from lithops.standalone.utils import (
     StandaloneMode,
     LithopsValidationError,
     get_host_setup_script,
-    get_master_setup_script
+    get_master_setup_script,
+    json_dumps,
+    json_loads
 )
 from lithops.version import __version__
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_backend_class(backend_name):
+    """
+    Imports and returns the StandaloneBackend class of the given backend.
+    Handlers are created repeatedly (once per job in the master service),
+    so the module lookup is resolved once per backend
+    """
+    module_location = f'lithops.standalone.backends.{backend_name}'
+    sb_module = importlib.import_module(module_location)
+    return getattr(sb_module, 'StandaloneBackend')
+
+
 class StandaloneHandler:
     """
     A StandaloneHandler object is used by invokers and other components to access
@@ -60,9 +75,17 @@ class StandaloneHandler:
         self.exec_mode = StandaloneMode[self.config['exec_mode'].upper()]
         self.is_lithops_worker = is_lithops_worker()
 
-        module_location = f'lithops.standalone.backends.{self.backend_name}'
-        sb_module = importlib.import_module(module_location)
-        StandaloneBackend = getattr(sb_module, 'StandaloneBackend')
+        # Shared HTTP session so consecutive requests to the master
+        # service reuse keep-alive connections instead of opening a new
+        # TCP connection per call
+        self.session = requests.Session()
+
+        # base URLs towards the master service, built once instead of
+        # being reassembled on every request
+        self.master_url = f'http://lithops-master:{SA_MASTER_SERVICE_PORT}'
+        self.tunnel_url = f'http://127.0.0.1:{SA_MASTER_SERVICE_PORT}'
+
+        StandaloneBackend = _get_backend_class(self.backend_name)
         self.backend = StandaloneBackend(self.config[self.backend_name], self.exec_mode.value)
 
         self.jobs = []  # list to store executed jobs (job_keys)
@@ -98,24 +121,54 @@ class StandaloneHandler:
         """
         return self.backend.list_images()
 
+    def _make_tunnel_request(self, method, endpoint, data=None):
+        """
+        Makes a request to the master service through a direct-tcpip
+        channel opened on the master SSH transport. The raw HTTP request
+        travels over the already-established connection, so no remote
+        curl process has to be spawned per call
+        """
+        channel = self.backend.master.get_ssh_client().open_tunnel_channel(SA_MASTER_SERVICE_PORT)
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', SA_MASTER_SERVICE_PORT, timeout=5)
+            conn.sock = channel
+            body = json_dumps(data) if data is not None else None
+            conn.request(method, f'/{endpoint}', body=body,
+                         headers={'Content-Type': 'application/json'})
+            out = conn.getresponse().read()
+        finally:
+            channel.close()
+        try:
+            return json_loads(out)
+        except Exception:
+            raise ValueError(out.decode())
+
     def _make_request(self, method, endpoint, data=None):
         """
         Makes a requests to the master VM
         """
         if self.is_lithops_worker:
-            url = f"http://lithops-master:{SA_MASTER_SERVICE_PORT}/{endpoint}"
+            url = f"{self.master_url}/{endpoint}"
             if method == 'GET':
-                resp = requests.get(url, timeout=1)
+                resp = self.session.get(url, timeout=1)
                 return resp.json()
             elif method == 'POST':
-                resp = requests.post(url, data=json.dumps(data))
+                resp = self.session.post(url, data=json_dumps(data))
                 resp.raise_for_status()
                 return resp.json()
         else:
-            url = f'http://127.0.0.1:{SA_MASTER_SERVICE_PORT}/{endpoint}'
+            try:
+                return self._make_tunnel_request(method, endpoint, data)
+            except ValueError as e:
+                raise e
+            except Exception as e:
+                logger.debug(f'Request through ssh tunnel failed: {e}. Falling back to curl')
+            url = f'{self.tunnel_url}/{endpoint}'
             cmd = f'curl -X {method} {url} -H \'Content-Type: application/json\''
             if data is not None:
-                json_data = json.dumps(data)
+                # serialize the payload once; the same bytes are used for
+                # the size check and for whichever transport is chosen
+                json_data = json_dumps(data).decode()
                 data_size = len(json_data)
                 if data_size < 130000:
                     data_str = shlex.quote(json_data)
@@ -128,7 +181,7 @@ class StandaloneHandler:
             if not out:
                 raise ValueError(err)
             try:
-                return json.loads(out)
+                return json_loads(out)
             except Exception:
                 raise ValueError(out)
 
@@ -176,12 +229,17 @@ class StandaloneHandler:
         logger.info(f'Waiting Lithops service to become ready on {self.backend.master}')
 
         start = time.time()
+        probe_interval = 0.25
+
         while (time.time() - start < self.start_timeout):
             if self._is_master_service_ready():
                 ready_time = round(time.time() - start, 2)
                 logger.debug(f'{self.backend.master} ready in {ready_time} seconds')
                 return True
-            time.sleep(2)
+            # exponential backoff: react fast when the service is almost up,
+            # without hammering it during a long cold start
+            time.sleep(probe_interval)
+            probe_interval = min(probe_interval * 2, 4)
 
         self.dismantle()
         raise Exception(f'Lithops service readiness probe expired on {self.backend.master}')
@@ -287,13 +345,6 @@ class StandaloneHandler:
         logger.debug(f'ExecutorID {executor_id} | JobID {job_id} - Going to run '
                      f'{total_calls} activations in {total_workers} workers')
 
-        logger.debug(f"Checking if {self.backend.master} is ready")
-        if not self._is_master_service_ready():
-            self.backend.master.create(check_if_exists=True)
-            self.backend.master.wait_ready()
-            self._validate_master_service_setup()
-            self._wait_master_service_ready()
-
         # delete ssh key
         backend = job_payload['config']['lithops']['backend']
         job_payload['config'][backend].pop('ssh_key_filename', None)
@@ -307,8 +358,20 @@ class StandaloneHandler:
             for inst in new_workers
         ]
 
-        # invoke Job
-        self._make_request('POST', 'job/run', job_payload)
+        # invoke Job. The submission itself tells whether the master
+        # service is up, so on a warm master no separate readiness probe
+        # is paid; if it fails, bootstrap the master and retry once
+        try:
+            self._make_request('POST', 'job/run', job_payload)
+        except LithopsValidationError as e:
+            raise e
+        except Exception:
+            logger.debug(f"{self.backend.master} is not ready")
+            self.backend.master.create(check_if_exists=True)
+            self.backend.master.wait_ready()
+            self._validate_master_service_setup()
+            self._wait_master_service_ready()
+            self._make_request('POST', 'job/run', job_payload)
         logger.debug(f'Job invoked on {self.backend.master}')
 
         self.jobs.append(job_payload['job_key'])
@@ -412,15 +475,16 @@ class StandaloneHandler:
 
         ssh_client = self.backend.master.get_ssh_client()
 
-        handler_zip = os.path.join(TEMP_DIR, f'lithops_standalone_{str(uuid.uuid4())[-6:]}.zip')
+        # build the zip in memory and stream it; there is no need to write
+        # a temporary file to disk and delete it afterwards
+        handler_zip = io.BytesIO()
         worker_path = os.path.join(os.path.dirname(__file__), 'worker.py')
         master_path = os.path.join(os.path.dirname(__file__), 'master.py')
         runner_path = os.path.join(os.path.dirname(__file__), 'runner.py')
         create_handler_zip(handler_zip, [master_path, worker_path, runner_path])
 
         logger.debug(f'Uploading lithops files to {self.backend.master}')
-        ssh_client.upload_local_file(handler_zip, '/tmp/lithops_standalone.zip')
-        os.remove(handler_zip)
+        ssh_client.upload_fileobj(handler_zip, '/tmp/lithops_standalone.zip')
 
         master_data = {
             'name': self.backend.master.name,
@@ -1,6 +1,12 @@
 import os
 import json
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from lithops.constants import (
     SA_INSTALL_DIR,
@@ -43,6 +49,24 @@ class LithopsValidationError(Exception):
     pass
 
 
+def json_dumps(obj):
+    """
+    Serializes an object to JSON bytes, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode()
+
+
+def json_loads(data):
+    """
+    Deserializes a JSON str/bytes, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 MASTER_SERVICE_NAME = 'lithops-master.service'
 MASTER_SERVICE_FILE = f"""
 [Unit]
@@ -101,9 +125,12 @@ runcmd:
 """
 
 
+@lru_cache(maxsize=None)
 def get_host_setup_script(docker=True):
     """
-    Returns the script necessary for installing a lithops VM host
+    Returns the script necessary for installing a lithops VM host.
+    The script only depends on the docker flag, so it is generated
+    once and cached for the per-worker setup calls
     """
     script = f"""#!/bin/bash
     mkdir -p {SA_INSTALL_DIR};
@@ -150,7 +177,7 @@ def get_host_setup_script(docker=True):
     if [[ ! $(pip3 list|grep "lithops") ]]; then
     wait_internet_connection;
     echo "--> Installing Lithops python dependencies"
-    pip3 install -U pip flask gevent lithops[all];
+    pip3 install -U pip flask gevent inotify-simple orjson lithops[all];
     fi;
     }}
     install_packages >> {SA_SETUP_LOG_FILE} 2>&1
@@ -210,11 +237,25 @@ def get_master_setup_script(config, vm_data):
     return script
 
 
-def get_worker_setup_script(config, vm_data):
+@lru_cache(maxsize=None)
+def _get_master_pub_key(home_dir):
     """
-    Returns worker VM installation script
-    this script is expected to be executed only from Master VM
+    Returns the master public key, read once per ssh user. Read errors
+    propagate so that only successful reads are memoized
     """
+    return open(f'{home_dir}/.ssh/lithops_id_rsa.pub', 'r').read()
+
+
+@lru_cache(maxsize=None)
+def _get_worker_setup_script_template(config_json):
+    """
+    Builds the config-dependent part of the worker setup script. The
+    script is identical for all the workers of a fleet except for the VM
+    data and the master IP, so those are left as placeholders and the
+    template is built once per config instead of once per VM
+    """
+    config = json.loads(config_json)
+
     if config['runtime'].startswith(('python', '/')):
         cmd_pre = cmd_stop = "id"
         cmd_start = f"/usr/bin/python3 {SA_INSTALL_DIR}/worker.py"
@@ -234,7 +275,7 @@ def get_worker_setup_script(config, vm_data):
     setup_host(){{
     unzip -o /tmp/lithops_standalone.zip -d {SA_INSTALL_DIR};
     rm /tmp/lithops_standalone.zip;
-    echo '{json.dumps(vm_data)}' > {SA_WORKER_DATA_FILE};
+    echo '__VM_DATA__' > {SA_WORKER_DATA_FILE};
     echo '{json.dumps(config)}' > {SA_CONFIG_FILE};
     }}
     setup_host >> {SA_SETUP_LOG_FILE} 2>&1;
@@ -248,15 +289,26 @@ def get_worker_setup_script(config, vm_data):
     systemctl start {WORKER_SERVICE_NAME};
     }}
     setup_service >> {SA_SETUP_LOG_FILE} 2>&1
-    echo '{vm_data['master_ip']} lithops-master' >> /etc/hosts
+    echo '__MASTER_IP__ lithops-master' >> /etc/hosts
     echo 'tail -f -n 100 {SA_WORKER_LOG_FILE}'>> $USER_HOME/.bash_history
     """
+    return script
+
+
+def get_worker_setup_script(config, vm_data):
+    """
+    Returns worker VM installation script
+    this script is expected to be executed only from Master VM
+    """
+    script = _get_worker_setup_script_template(json.dumps(config, sort_keys=True))
+    script = script.replace('__VM_DATA__', json.dumps(vm_data))
+    script = script.replace('__MASTER_IP__', vm_data['master_ip'])
 
     if "ssh_credentials" in vm_data:
         ssh_user = vm_data['ssh_credentials']['username']
         home_dir = '/root' if ssh_user == 'root' else f'/home/{ssh_user}'
         try:
-            master_pub_key = open(f'{home_dir}/.ssh/lithops_id_rsa.pub', 'r').read()
+            master_pub_key = _get_master_pub_key(home_dir)
         except Exception:
             master_pub_key = ''
         script += f"""
@@ -15,24 +15,35 @@
 # limitations under the License.
 #
 
-import os
-import time
-import json
-import redis
-import flask
-import logging
-import signal
-import subprocess as sp
-from pathlib import Path
-from threading import Thread
-from functools import partial
-from gevent.pywsgi import WSGIServer
-from concurrent.futures import ThreadPoolExecutor
-
-from lithops.utils import setup_lithops_logger
-from lithops.standalone.keeper import BudgetKeeper
-from lithops.standalone.utils import JobStatus, StandaloneMode, WorkerStatus
-from lithops.constants import (
+# Patch the stdlib before anything else is imported, so every lock,
+# socket and poll object created at module scope (including the ones
+# inside the imported libraries) is gevent-cooperative
+from gevent import monkey
+monkey.patch_all()
+
+import os  # noqa: E402
+import time  # noqa: E402
+import redis  # noqa: E402
+import flask  # noqa: E402
+import logging  # noqa: E402
+import signal  # noqa: E402
+import subprocess as sp  # noqa: E402
+from pathlib import Path  # noqa: E402
+from threading import Thread  # noqa: E402
+from functools import partial  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+
+from lithops.utils import setup_lithops_logger  # noqa: E402
+from lithops.standalone.keeper import BudgetKeeper  # noqa: E402
+from lithops.standalone.utils import (  # noqa: E402
+    JobStatus,
+    StandaloneMode,
+    WorkerStatus,
+    json_dumps,
+    json_loads
+)
+from lithops.constants import (  # noqa: E402
     CPU_COUNT,
     LITHOPS_TEMP_DIR,
     RN_LOG_FILE,
@@ -63,13 +74,28 @@ worker_threads = {}
 canceled = []
 
 
+PING_CACHE_TTL = 1  # seconds
+
+ping_response = None
+ping_response_tstamp = 0
+
+
 @app.route('/ping', methods=['GET'])
 def ping():
-    idle_count = sum(1 for worker in worker_threads.values() if worker['status'] == WorkerStatus.IDLE.value)
-    busy_count = sum(1 for worker in worker_threads.values() if worker['status'] == WorkerStatus.BUSY.value)
-    response = flask.jsonify({'busy': busy_count, 'free': idle_count})
-    response.status_code = 200
-    return response
+    global ping_response
+    global ping_response_tstamp
+
+    # cache the response for a short period to absorb probe storms from
+    # the master when many jobs look for free workers at once
+    now = time.monotonic()
+    if ping_response is None or now - ping_response_tstamp > PING_CACHE_TTL:
+        idle_count = sum(1 for worker in worker_threads.values() if worker['status'] == WorkerStatus.IDLE.value)
+        busy_count = sum(1 for worker in worker_threads.values() if worker['status'] == WorkerStatus.BUSY.value)
+        ping_response = flask.jsonify({'busy': busy_count, 'free': idle_count})
+        ping_response.status_code = 200
+        ping_response_tstamp = now
+
+    return ping_response
 
 
 @app.route('/ttd', methods=['GET'])
@@ -153,15 +179,22 @@ def redis_queue_consumer(pid, work_queue_name, exec_mode, backend):
 
     logger.info(f"Redis consumer process {pid} started")
 
+    # single append-mode handle for the runner output; opening it per
+    # task leaked one file descriptor per execution
+    runner_log = open(RN_LOG_FILE, 'a')
+
     while True:
         if exec_mode == StandaloneMode.CONSUME.value:
-            task_payload_str = redis_client.rpop(work_queue_name)
-            if not task_payload_str:
-                time.sleep(1)
+            # block in redis for up to one second instead of polling with
+            # rpop + sleep; new tasks are picked up as soon as they are
+            # pushed while the timeout keeps the idle-exit check alive
+            task = redis_client.brpop(work_queue_name, timeout=1)
+            if task is None:
                 if all(worker['status'] == WorkerStatus.IDLE.value
                        for worker in worker_threads.values()):
                     break
                 continue
+            task_payload_str = task[1]
         elif exec_mode == StandaloneMode.REUSE.value:
             key, task_payload_str = redis_client.brpop(work_queue_name)
         else:
@@ -171,7 +204,7 @@ def redis_queue_consumer(pid, work_queue_name, exec_mode, backend):
 
         worker_threads[pid]['status'] = WorkerStatus.BUSY.value
 
-        task_payload = json.loads(task_payload_str)
+        task_payload = json_loads(task_payload_str)
 
         executor_id = task_payload['executor_id']
         job_id = task_payload['job_id']
@@ -189,12 +222,11 @@ def redis_queue_consumer(pid, work_queue_name, exec_mode, backend):
 
             task_filename = os.path.join(JOBS_DIR, f'{job_key_call_id}.task')
 
-            with open(task_filename, 'w') as jl:
-                json.dump(task_payload, jl, default=str)
+            with open(task_filename, 'wb') as jl:
+                jl.write(json_dumps(task_payload))
 
             cmd = ["python3", f"{SA_INSTALL_DIR}/runner.py", backend, task_filename]
-            log = open(RN_LOG_FILE, 'a')
-            process = sp.Popen(cmd, stdout=log, stderr=log, start_new_session=True)
+            process = sp.Popen(cmd, stdout=runner_log, stderr=runner_log, start_new_session=True)
             job_processes[job_key_call_id] = process
             process.communicate()  # blocks until the process finishes
             del job_processes[job_key_call_id]
@@ -216,6 +248,7 @@ def redis_queue_consumer(pid, work_queue_name, exec_mode, backend):
 
         worker_threads[pid]['status'] = WorkerStatus.IDLE.value
 
+    runner_log.close()
     logger.info(f"Redis consumer process {pid} finished")
 
 
@@ -228,12 +261,12 @@ def run_worker():
 
     # read the Lithops standaole configuration file
     with open(SA_CONFIG_FILE, 'r') as cf:
-        standalone_config = json.load(cf)
+        standalone_config = json_loads(cf.read())
 
     # Read the VM data file that contains the instance id, the master IP,
     # and the queue for getting tasks
     with open(SA_WORKER_DATA_FILE, 'r') as ad:
-        worker_data = json.load(ad)
+        worker_data = json_loads(ad.read())
 
     # Start the redis client
     redis_client = redis.Redis(host=worker_data['master_ip'], decode_responses=True)
@@ -267,7 +300,10 @@ def run_worker():
     redis_queue_consumer_futures = []
     with ThreadPoolExecutor(max_workers=worker_processes) as executor:
         for i in range(worker_processes):
-            worker_threads[i] = {}
+            # set the status before the consumer thread starts, otherwise a
+            # /ping probe arriving first hits a KeyError and the master
+            # discards this worker as not free
+            worker_threads[i] = {'status': WorkerStatus.STARTING.value}
             future = executor.submit(
                 redis_queue_consumer, i,
                 worker_data['work_queue_name'],
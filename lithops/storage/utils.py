@@ -18,6 +18,7 @@
 import os
 import time
 import logging
+from functools import lru_cache
 from lithops.constants import JOBS_PREFIX
 
 
@@ -93,9 +94,11 @@ def clean_bucket(storage, bucket, prefix, sleep=5):
     logger.info(f'Finished deleting objects, total found: {total_objects}')
 
 
+@lru_cache(maxsize=1024)
 def create_job_key(executor_id, job_id):
     """
-    Create job key
+    Create job key. Memoized, since the status/output/init key builders
+    and the futures call it repeatedly with the same pair of ids
     :param executor_id: prefix
     :param job_id: Job's ID
     :return: exec id
@@ -144,7 +144,10 @@ def find_shared_objects(calls):
     calls = [list(item) for item in calls]
 
     storage = Storage()
-    thread_pool = ThreadPoolExecutor(max_workers=len(record))
+    # one argument object can be uploaded per thread; sizing the pool to
+    # the number of distinct objects spawns thousands of threads on big
+    # fan-outs for no extra storage throughput
+    thread_pool = ThreadPoolExecutor(max_workers=min(len(record), 64))
 
     def put_arg_obj(positions):
         obj = positions.pop(0)
@@ -194,7 +197,7 @@ def handle_call_process(func, args, kwargs, proxy_positions=[]):
 
 def replace_with_values(args, kwargs, proxy_positions):
     args_as_list = list(args)
-    thread_pool = ThreadPoolExecutor(max_workers=len(proxy_positions))
+    thread_pool = ThreadPoolExecutor(max_workers=min(len(proxy_positions), 64))
     cache = diskcache.Cache(os.path.join(LITHOPS_TEMP_DIR, 'cache'))
 
     def get_arg_obj(idx_or_key):
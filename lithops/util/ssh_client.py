@@ -1,5 +1,6 @@
 import paramiko
 import logging
+import threading
 import os
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,7 @@ class SSHClient():
         self.ip_address = ip_address
         self.ssh_credentials = ssh_credentials
         self.ssh_client = None
+        self.sftp_client = None
 
         if 'key_filename' in self.ssh_credentials:
             fpath = os.path.expanduser(self.ssh_credentials['key_filename'])
@@ -25,12 +27,21 @@ class SSHClient():
         """
         self.ssh_client.close()
         self.ssh_client = None
+        self.sftp_client = None
+
+    def is_active(self):
+        """
+        Checks if the underlying SSH transport is established and alive
+        """
+        transport = self.ssh_client.get_transport() if self.ssh_client else None
+        return bool(transport and transport.is_active())
 
     def create_client(self, timeout=2):
         """
         Crate the SSH client connection
         """
         try:
+            self.sftp_client = None
             self.ssh_client = paramiko.SSHClient()
             self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -70,8 +81,12 @@ class SSHClient():
         try:
             stdin, stdout, stderr = self.ssh_client.exec_command(cmd, timeout=timeout)
         except Exception:
-            # Normally this is a timeout exception
-            self.ssh_client = self.create_client()
+            # Each command runs on its own channel, so as long as the
+            # transport is alive we can retry over it without paying a
+            # new TCP+SSH handshake. Only rebuild the connection when
+            # the transport itself is gone
+            if not self.is_active():
+                self.ssh_client = self.create_client()
             stdin, stdout, stderr = self.ssh_client.exec_command(cmd, timeout=timeout)
 
         out = None
@@ -83,22 +98,43 @@ class SSHClient():
 
         return out, err
 
+    def open_tunnel_channel(self, dst_port, dst_host='127.0.0.1'):
+        """
+        Opens a direct-tcpip channel towards a port on the remote host,
+        tunneled over the current transport
+        """
+        if self.ssh_client is None:
+            self.ssh_client = self.create_client()
+
+        transport = self.ssh_client.get_transport()
+        return transport.open_channel('direct-tcpip', (dst_host, dst_port), ('127.0.0.1', 0))
+
+    def get_sftp_client(self):
+        """
+        Returns an SFTP channel over the current transport. The channel is
+        opened once and reused by all the transfer methods, so consecutive
+        operations against the same host share one session
+        """
+        if self.ssh_client is None:
+            self.ssh_client = self.create_client()
+
+        if self.sftp_client is None or self.sftp_client.sock.closed:
+            self.sftp_client = self.ssh_client.open_sftp()
+
+        return self.sftp_client
+
     def download_remote_file(self, remote_src, local_dst):
         """
         Downloads a remote file to a local destination
         param: local_src: local file path source
         param: remote_dst: remote file path destination
         """
-        if self.ssh_client is None:
-            self.ssh_client = self.create_client()
-
         dirname = os.path.dirname(local_dst)
         if dirname and not os.path.exists(dirname):
             os.makedirs(dirname)
 
-        ftp_client = self.ssh_client.open_sftp()
+        ftp_client = self.get_sftp_client()
         ftp_client.get(remote_src, local_dst)
-        ftp_client.close()
 
     def upload_local_file(self, local_src, remote_dst):
         """
@@ -106,25 +142,37 @@ class SSHClient():
         param: local_src: local file path source
         param: remote_dst: remote file path destination
         """
-        if self.ssh_client is None:
-            self.ssh_client = self.create_client()
-
-        ftp_client = self.ssh_client.open_sftp()
-        ftp_client.put(local_src, remote_dst)
-        ftp_client.close()
+        ftp_client = self.get_sftp_client()
+
+        # pipeline the writes so large files are not throttled
+        # to one SFTP packet acknowledgment per round-trip
+        with open(local_src, 'rb') as local_file, \
+                ftp_client.open(remote_dst, 'wb') as remote_file:
+            remote_file.set_pipelined(True)
+            while True:
+                data = local_file.read(262144)
+                if not data:
+                    break
+                remote_file.write(data)
 
     def upload_multiple_local_files(self, file_list):
         """
         upload multiple files with the same sftp connection
         param: file_list: list of tuples [(local_src, remote_dst),]
         """
-        if self.ssh_client is None:
-            self.ssh_client = self.create_client()
-
-        ftp_client = self.ssh_client.open_sftp()
+        ftp_client = self.get_sftp_client()
         for local_src, remote_dst in file_list:
             ftp_client.put(local_src, remote_dst)
-        ftp_client.close()
+
+    def upload_fileobj(self, fileobj, remote_dst):
+        """
+        upload an in-memory file object to a remote file
+        param: fileobj: file-like object opened in binary mode
+        param: remote_dst: remote file path destination
+        """
+        ftp_client = self.get_sftp_client()
+        fileobj.seek(0)
+        ftp_client.putfo(fileobj, remote_dst)
 
     def upload_data_to_file(self, data, remote_dst):
         """
@@ -132,12 +180,49 @@ class SSHClient():
         param: data: string data
         param: remote_dst: remote file path destination
         """
-        if self.ssh_client is None:
-            self.ssh_client = self.create_client()
-
-        ftp_client = self.ssh_client.open_sftp()
+        ftp_client = self.get_sftp_client()
 
         with ftp_client.open(remote_dst, 'w') as f:
             f.write(data)
 
-        ftp_client.close()
+
+# Pool of SSHClient instances shared across instance objects. Standalone
+# handlers are recreated frequently around the same VMs (one per job in
+# the master service), and without the pool every new instance object
+# pays a full SSH handshake against a host that already has a live
+# connection
+ssh_clients = {}
+ssh_clients_lock = threading.Lock()
+
+
+def get_pooled_ssh_client(ip_address, ssh_credentials):
+    """
+    Returns a shared SSHClient for the given host and credentials
+    """
+    key = (ip_address,
+           ssh_credentials.get('username'),
+           ssh_credentials.get('password'),
+           ssh_credentials.get('key_filename'))
+
+    with ssh_clients_lock:
+        ssh_client = ssh_clients.get(key)
+        if ssh_client is None:
+            ssh_client = SSHClient(ip_address, ssh_credentials)
+            ssh_clients[key] = ssh_client
+
+    return ssh_client
+
+
+def discard_pooled_ssh_client(ssh_client):
+    """
+    Closes an SSHClient and removes it from the pool
+    """
+    with ssh_clients_lock:
+        for key, client in list(ssh_clients.items()):
+            if client is ssh_client:
+                del ssh_clients[key]
+
+    try:
+        ssh_client.close()
+    except Exception:
+        pass